@@ -0,0 +1,125 @@
+"""
+Caches of SQL parse results: sqlfluff parse trees in memory, shared by every module that
+parses SQL, and per-file results on disk keyed by a hash of the SQL contents.
+
+On disk results live in a subdirectory per cache key prefix, so once gitsnow or its parsing
+libraries change, every result they might have changed can be dropped by removing old subdirectories.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from importlib.metadata import version
+from pathlib import Path
+from typing import Callable, Optional
+
+from sqlfluff.core import FluffConfig, Linter
+
+# The SQL dialect all scripts are parsed as
+DIALECT = "snowflake"
+
+CACHE_DIR_NAME = '.gitsnow-cache'
+
+# Bump when the shape or meaning of cached results changes, so stale entries are never read
+_CACHE_VERSION = b'1'
+
+
+def _source_fingerprint() -> bytes:
+    """Hash of this package's source, since cached results are produced by its extraction code."""
+    digest = hashlib.blake2b(digest_size=16)
+    for source_file in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(source_file.name.encode() + b'\0' + source_file.read_bytes())
+    return digest.digest()
+
+
+# Cached results are derived by this package's code and these libraries, so changing any of them invalidates them
+_CACHE_KEY_PREFIX = b'\0'.join(
+    (_CACHE_VERSION, _source_fingerprint(), version("sqlfluff").encode(), version("sqllineage").encode())
+)
+# Subdirectory of the cache directory that entries under the current prefix are stored in
+_CACHE_GENERATION = hashlib.blake2b(_CACHE_KEY_PREFIX, digest_size=8).hexdigest()
+
+# Cache directory - will be configured by the DI container. Caching is disabled while None.
+_cache_dir: Optional[Path] = None
+
+
+@functools.lru_cache(maxsize=8)
+def get_linter(dialect: str) -> Linter:
+    """Get a parsing linter for the dialect, built once since FluffConfig construction is expensive."""
+    return Linter(config=FluffConfig(overrides={"dialect": dialect}))
+
+
+# Parse trees run to megabytes each for larger scripts, so only keep the most recent few
+@functools.lru_cache(maxsize=32)
+def parse_tree(sql: str, dialect: str):
+    """
+    Parse SQL to a sqlfluff tree, or None if it can't be parsed.
+    Shared between dependency extraction and diffing so SQL text being worked on is only parsed once.
+    """
+    return get_linter(dialect).parse_string(sql).tree
+
+
+def configure_parse_cache(cache_dir: Optional[Path] = None) -> None:
+    """Configure the directory parse results are cached in, or disable caching with None."""
+    global _cache_dir
+    _cache_dir = cache_dir
+
+
+def get_parse_cache_dir() -> Optional[Path]:
+    """Get the configured cache directory, or None if caching is disabled."""
+    return _cache_dir
+
+
+def prune_parse_cache() -> None:
+    """Remove cached results written under any other cache key prefix, which can never be read again."""
+    if _cache_dir is None:
+        return
+    try:
+        stale_dirs = [entry for entry in _cache_dir.iterdir() if entry.is_dir() and entry.name != _CACHE_GENERATION]
+    except OSError:
+        return
+    for stale_dir in stale_dirs:
+        shutil.rmtree(stale_dir, ignore_errors=True)
+
+
+def cached_parse(kind: str, sql_bytes: bytes, fn: Callable[[], dict]) -> dict:
+    """
+    Return the cached result of parsing sql_bytes, calling fn to compute and store it on a miss.
+
+    Args:
+        kind: Name of the parse being cached, so different parses of the same SQL don't collide.
+              It must also identify any configuration the result depends on.
+        sql_bytes: The SQL contents the result is derived from
+        fn: Computes the result; it must be JSON serializable and depend only on sql_bytes and kind
+    """
+    if _cache_dir is None:
+        return fn()
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(kind.encode() + b'\0')
+    digest.update(sql_bytes)
+    entries_dir = _cache_dir / _CACHE_GENERATION
+    cache_file = entries_dir / f"{digest.hexdigest()}.json"
+
+    try:
+        return json.loads(cache_file.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        logging.debug("Ignoring unreadable parse cache entry %s: %s", cache_file, e)
+
+    result = fn()
+    try:
+        entries_dir.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent readers never see a partial entry
+        fd, tmp_name = tempfile.mkstemp(dir=entries_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding="utf-8") as tmp_file:
+            json.dump(result, tmp_file)
+        os.replace(tmp_name, cache_file)
+    except OSError as e:
+        logging.debug("Could not write parse cache entry %s: %s", cache_file, e)
+    return result
@@ -5,12 +5,9 @@ from . import db
 from .db_mock import get_mock_connection
 from .dependencies import get_dependency_ordered_objects, build_debug_trace_plan, parse_debug_query
 from .format import format_sql
-from .diff import get_semantic_changed_files, semantic_diff, get_objects_from_files, get_db_object_details
+from .diff import get_semantic_changed_files
 from .container import configure_services
-from sqlfluff.core import Linter, FluffConfig
-
-config = FluffConfig(overrides={"dialect": "snowflake"})
-linter = Linter(config=config)
+from ._parse_cache import CACHE_DIR_NAME
 
 @click.group()
 @click.option('--scripts-dir', required=True, type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
@@ -21,9 +18,9 @@ def cli(ctx, scripts_dir):
     # Ensure that ctx.obj exists and is a dict (it will be passed to subcommands)
     ctx.ensure_object(dict)
     
-    # Configure services with the parent directory of scripts_dir for config
+    # Configure services with the parent directory of scripts_dir for config and parse cache
     config_path = scripts_dir.parent / '.sqlfluff'
-    configure_services(config_path)
+    configure_services(config_path, scripts_dir.parent / CACHE_DIR_NAME)
     
     # Store scripts_dir in context for use by subcommands
     ctx.obj['scripts_dir'] = scripts_dir
@@ -47,35 +44,36 @@ def db_to_folder(ctx, db_name, schemas, test):
 
         click.echo(f"Exporting objects from database '{db_name}' to '{scripts_dir}'...")
 
-        for schema_name in schemas:
-            objects = db.get_objects_in_schema(conn, db_name, schema_name)
+        with conn.cursor() as cursor:
+            for schema_name in schemas:
+                objects = db.get_objects_in_schema(conn, db_name, schema_name, cursor=cursor)
             
-            # Group objects by (type, name) to handle overloaded functions/procedures
-            from collections import defaultdict
-            grouped_objects = defaultdict(list)
-            for obj in objects:
-                key = (obj.type.lower(), obj.name.lower())
-                grouped_objects[key].append(obj)
+                # Group objects by (type, name) to handle overloaded functions/procedures
+                from collections import defaultdict
+                grouped_objects = defaultdict(list)
+                for obj in objects:
+                    key = (obj.type.lower(), obj.name.lower())
+                    grouped_objects[key].append(obj)
             
-            # Write each group to a single file
-            for (obj_type, obj_name), obj_group in grouped_objects.items():
-                obj_type_dir = output_path / schema_name.lower() / (obj_type + 's')
-                obj_type_dir.mkdir(parents=True, exist_ok=True)
+                # Write each group to a single file
+                for (obj_type, obj_name), obj_group in grouped_objects.items():
+                    obj_type_dir = output_path / schema_name.lower() / (obj_type + 's')
+                    obj_type_dir.mkdir(parents=True, exist_ok=True)
                 
-                # Sort objects by their args for consistency (None/empty args first)
-                obj_group.sort(key=lambda o: (o.ddl if hasattr(o, 'ddl') else '', ''))
+                    # Sort objects by their args for consistency (None/empty args first)
+                    obj_group.sort(key=lambda o: (o.ddl if hasattr(o, 'ddl') else '', ''))
                 
-                # Format and combine DDLs with triple newline separator
-                formatted_ddls = [format_sql(obj.ddl) for obj in obj_group]
-                combined_ddl = '\n\n\n'.join(formatted_ddls)
+                    # Format and combine DDLs with triple newline separator
+                    formatted_ddls = [format_sql(obj.ddl) for obj in obj_group]
+                    combined_ddl = '\n\n\n'.join(formatted_ddls)
                 
-                file_path = obj_type_dir / f"{obj_name}.sql"
-                file_path.write_text(combined_ddl)
+                    file_path = obj_type_dir / f"{obj_name}.sql"
+                    file_path.write_text(combined_ddl)
                 
-                if len(obj_group) > 1:
-                    click.echo(f"  - Wrote {file_path} ({len(obj_group)} overloads)")
-                else:
-                    click.echo(f"  - Wrote {file_path}")
+                    if len(obj_group) > 1:
+                        click.echo(f"  - Wrote {file_path} ({len(obj_group)} overloads)")
+                    else:
+                        click.echo(f"  - Wrote {file_path}")
 
         click.echo("Export complete.")
     except Exception as e:
@@ -101,7 +99,7 @@ def folder_to_script(ctx, db_name, output_file, test):
         click.echo(f"Found {len(ordered_obj_paths)} folder objects.")
 
         schemas = db.get_all_schemas(conn, db_name)
-        db_objects = [obj for schema in schemas for obj in db.get_objects_in_schema(conn, db_name, schema)]
+        db_objects = db.get_objects_in_schemas(conn, db_name, schemas)
         click.echo(f"Found {len(db_objects)} database objects.")
                 
         changed_files = get_semantic_changed_files(ordered_obj_paths, db_objects, scripts_path)
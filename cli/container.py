@@ -3,6 +3,7 @@
 from pathlib import Path
 from typing import Optional
 
+from ._parse_cache import configure_parse_cache, prune_parse_cache
 from .format import configure_formatter
 
 
@@ -12,19 +13,25 @@ class Container:
     def __init__(self):
         self._configured = False
     
-    def configure(self, config_path: Optional[Path] = None) -> None:
+    def configure(self, config_path: Optional[Path] = None, cache_dir: Optional[Path] = None) -> None:
         """
         Configure all services with the given configuration.
         
         Args:
             config_path: Optional path to configuration directory or file.
                         If None, services will use their default configuration discovery.
+            cache_dir: Optional directory to persist parse results in between runs.
+                        If None, parse results are not persisted.
         """
         if self._configured:
             return  # Already configured
         
         # Configure the SQL formatter
         configure_formatter(config_path)
+
+        # Configure the persistent parse cache, dropping results left by other gitsnow versions
+        configure_parse_cache(cache_dir)
+        prune_parse_cache()
         
         self._configured = True
     
@@ -45,6 +52,6 @@ def get_container() -> Container:
     return _container
 
 
-def configure_services(config_path: Optional[Path] = None) -> None:
+def configure_services(config_path: Optional[Path] = None, cache_dir: Optional[Path] = None) -> None:
     """Configure all services. This should be called at application startup."""
-    get_container().configure(config_path)
\ No newline at end of file
+    get_container().configure(config_path, cache_dir)
\ No newline at end of file
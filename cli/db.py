@@ -95,17 +95,22 @@ def _parse_function_signatures(function_name: str, raw_args: str) -> list[str |
 
 
 def get_objects_in_schema(conn: snowflake.connector.SnowflakeConnection, db_name: str, schema_name: str, cursor=None) -> list[SnowflakeObject]:
-    """Fetches all supported objects in a schema including functions, procedures, streams, and tasks.
+    """Fetches all supported objects in a schema including functions, procedures, streams, and tasks."""
+    return get_objects_in_schemas(conn, db_name, [schema_name], cursor)
 
-    This implementation first collects fully-qualified object names and their types, then
-    requests all DDLs in a single batched query via get_all_ddls, and finally constructs
-    SnowflakeObject instances from the batch result. This reduces round-trips for many objects.
+
+def get_objects_in_schemas(conn: snowflake.connector.SnowflakeConnection, db_name: str, schema_names: list[str], cursor=None) -> list[SnowflakeObject]:
+    """Fetches all supported objects in the given schemas including functions, procedures, streams, and tasks.
+
+    This implementation first collects fully-qualified object names and their types across all
+    the schemas, then requests all DDLs in a single batched query via get_all_ddls, and finally
+    constructs SnowflakeObject instances from the batch result. This reduces round-trips for many objects.
     """
 
     candidates: list[SnowflakeIdentifier] = []
     results: list[SnowflakeObject] = []
 
-    def _collect_from_show_command(cur, show_command: str, object_type: str, name_column_index: int = 1, args_column_index: int | None = None):
+    def _collect_from_show_command(cur, schema_name: str, show_command: str, object_type: str, name_column_index: int = 1, args_column_index: int | None = None):
         try:
             cur.execute(show_command)
             rows = cur.fetchall()
@@ -129,7 +134,7 @@ def get_objects_in_schema(conn: snowflake.connector.SnowflakeConnection, db_name
         except Exception as e:
             print(f"[Warning] Failed to execute {show_command}: {e}")
 
-    def _gather_objects(cur: SnowflakeCursor):
+    def _gather_objects(cur: SnowflakeCursor, schema_name: str):
         upper_db = db_name.upper()
         upper_schema = schema_name.upper()
         if upper_db in ("SNOWFLAKE",) or upper_schema in ("INFORMATION_SCHEMA",):
@@ -148,25 +153,28 @@ def get_objects_in_schema(conn: snowflake.connector.SnowflakeConnection, db_name
             print(f"[Warning] Failed to get objects from SHOW OBJECTS: {e}")
 
         # Other object types
-        _collect_from_show_command(cur, f'SHOW USER FUNCTIONS IN SCHEMA "{db_name}"."{schema_name}"', "FUNCTION", args_column_index=8)
-        _collect_from_show_command(cur, f'SHOW USER PROCEDURES IN SCHEMA "{db_name}"."{schema_name}"', "PROCEDURE", args_column_index=8)
-        _collect_from_show_command(cur, f'SHOW STREAMS IN SCHEMA "{db_name}"."{schema_name}"', "STREAM")
-        _collect_from_show_command(cur, f'SHOW TASKS IN SCHEMA "{db_name}"."{schema_name}"', "TASK")
+        _collect_from_show_command(cur, schema_name, f'SHOW USER FUNCTIONS IN SCHEMA "{db_name}"."{schema_name}"', "FUNCTION", args_column_index=8)
+        _collect_from_show_command(cur, schema_name, f'SHOW USER PROCEDURES IN SCHEMA "{db_name}"."{schema_name}"', "PROCEDURE", args_column_index=8)
+        _collect_from_show_command(cur, schema_name, f'SHOW STREAMS IN SCHEMA "{db_name}"."{schema_name}"', "STREAM")
+        _collect_from_show_command(cur, schema_name, f'SHOW TASKS IN SCHEMA "{db_name}"."{schema_name}"', "TASK")
+
+    def _gather_ddls(cur: SnowflakeCursor) -> dict[str, str]:
+        for schema_name in schema_names:
+            _gather_objects(cur, schema_name)
+        # Fetch all DDLs using the identifiers, on the same cursor
+        return get_all_ddls(conn, candidates, cur)
 
     # Use provided cursor or open one
     if cursor:
-        _gather_objects(cursor)
+        ddl_map = _gather_ddls(cursor)
     else:
         with conn.cursor() as cur:
-            _gather_objects(cur)
+            ddl_map = _gather_ddls(cur)
 
     # If nothing to fetch, return empty list
     if not candidates:
         return []
 
-    # Fetch all DDLs using the identifiers
-    ddl_map = get_all_ddls(conn, candidates)
-
     # Construct SnowflakeObject instances from batch results
     for candidate in candidates:
         # key format used by get_all_ddls is '{schema}.{simple_name}' (without quotes)
@@ -189,14 +197,20 @@ def get_objects_in_schema(conn: snowflake.connector.SnowflakeConnection, db_name
 
     return results
 
-def get_all_ddls(conn: snowflake.connector.SnowflakeConnection, objects: list[SnowflakeIdentifier]) -> dict[str, str]:
+# Objects per GET_DDL query, keeping statements well under Snowflake's size limit
+_DDL_BATCH_SIZE = 200
+
+
+def get_all_ddls(conn: snowflake.connector.SnowflakeConnection, objects: list[SnowflakeIdentifier], cursor=None) -> dict[str, str]:
     """
-    Fetches DDL for a list of objects in a single query.
+    Fetches DDL for a list of objects in batched queries, on the given cursor if provided.
+    Each batch is a single UNION ALL query of at most _DDL_BATCH_SIZE objects, which bounds the statement
+    size and means an object that fails GET_DDL only loses the DDL of its own batch.
     """
     if not objects:
         return {}
 
-    # Build a UNION ALL query to fetch all DDLs at once
+    # Build a UNION ALL query per batch of objects
     union_queries = []
     for obj in objects:
         # For FUNCTION and PROCEDURE, append argument types if present
@@ -206,25 +220,34 @@ def get_all_ddls(conn: snowflake.connector.SnowflakeConnection, objects: list[Sn
             ddl_name = obj.fully_qualified_name
         union_queries.append(f"SELECT '{ddl_name}' as obj_name, GET_DDL('{obj.object_type}', '{ddl_name}', TRUE) as ddl")
 
-    full_query = "\nUNION ALL\n".join(union_queries)
+    batch_queries = [
+        "\nUNION ALL\n".join(union_queries[i:i + _DDL_BATCH_SIZE])
+        for i in range(0, len(union_queries), _DDL_BATCH_SIZE)
+    ]
+
+    def _fetch_ddls(cur: SnowflakeCursor) -> dict[str, str]:
+        ddl_map = {}
+        for batch_query in batch_queries:
+            try:
+                cur.execute(batch_query)
+                rows = cur.fetchall()
+
+                for row in rows:
+                    obj_name, ddl = row
+                    if ddl and not ddl.startswith("-- Failed to get DDL"):
+                        [db_name, schema_name, simple_name] = obj_name.replace('"', '').split('.')
+                        ddl = _fixup_ddl_and_type(cur, db_name, schema_name, "UNKNOWN", ddl, simple_name)
+                        ddl_map[f'{schema_name}.{simple_name}'] = ddl
+            except snowflake.connector.errors.ProgrammingError as e:
+                tb = traceback.format_exc()
+                print(f"-- Failed to execute batch DDL query: {e}\nStack trace:\n{tb}")
+        return ddl_map
 
-    with conn.cursor() as cursor:
-        try:
-            cursor.execute(full_query)
-            rows = cursor.fetchall()
-
-            ddl_map = {}
-            for row in rows:
-                obj_name, ddl = row
-                if ddl and not ddl.startswith("-- Failed to get DDL"):
-                    [db_name, schema_name, simple_name] = obj_name.replace('"', '').split('.')
-                    ddl = _fixup_ddl_and_type(cursor, db_name, schema_name, "UNKNOWN", ddl, simple_name)
-                    ddl_map[f'{schema_name}.{simple_name}'] = ddl
-            return ddl_map
-        except snowflake.connector.errors.ProgrammingError as e:
-            tb = traceback.format_exc()
-            print(f"-- Failed to execute batch DDL query: {e}\nStack trace:\n{tb}")
-            return {}
+    # Use provided cursor or open one
+    if cursor:
+        return _fetch_ddls(cursor)
+    with conn.cursor() as cur:
+        return _fetch_ddls(cur)
 
 def _fixup_ddl_and_type(cursor: SnowflakeCursor, db_name: str, schema_name: str, kind_label: str, ddl: str, simple_name: str) -> str:
     """
@@ -1,16 +1,54 @@
+from array import array
 from dataclasses import dataclass
+import functools
+import hashlib
 import logging
+import os
 import re
 import warnings
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
-from graphlib import TopologicalSorter, CycleError
 from pathlib import Path
+from sys import intern
+from typing import Iterator
 from sqllineage.exceptions import SQLLineageException
 from sqllineage.runner import LineageRunner
-from sqlfluff.core import Linter, FluffConfig
+from sqlfluff.core import FluffConfig
+
+from ._parse_cache import DIALECT, cached_parse, configure_parse_cache, get_parse_cache_dir, parse_tree
+
+_CREATE_STATEMENT_TYPES = ("create_table_statement", "create_view_statement", "create_materialized_view_statement")
+# Below this many files, process pool start-up costs more than parsing serially
+_PARALLEL_PARSE_MIN_FILES = 32
+# Threads used to read SQL files concurrently, overlapping disk latency
+_READ_THREADS = 8
+
+# A bare or double-quoted Snowflake identifier
+_IDENT = r'(?:[A-Za-z_][\w$]*|"[^"]+")'
+# 1-3 dot-separated identifiers, each part captured separately
+_NAME3_RE = re.compile(rf'\b({_IDENT})(?:\s*\.\s*({_IDENT}))?(?:\s*\.\s*({_IDENT}))?\b')
+_STRIP_QUOTES_TABLE = str.maketrans('', '', '"')
+_COLUMN_LIST_DELIMITERS_RE = re.compile(r'[(),]')
+_DOT_SPLIT_RE = re.compile(r'\s*\.\s*')
+# Join edge patterns, matched against uppercased SQL
+_JOIN_TABLE_RE = re.compile(rf'\b(FROM|JOIN)\s+({_IDENT}(?:\s*\.\s*{_IDENT}){{1,2}})(?:\s+({_IDENT}))?')
+_JOIN_CONDITION_RE = re.compile(rf'({_IDENT})\s*\.\s*({_IDENT})\s*=\s*({_IDENT})\s*\.\s*({_IDENT})')
+_CREATE_TABLE_COLUMNS_RE = re.compile(r'\bcreate\b[\s\S]*?\btable\b[\s\S]*?\(', re.IGNORECASE)
+# A plain single-statement CREATE TABLE with a column list and a schema-qualified name.
+# Such DDL reads from no other objects, so lineage parsing can be skipped.
+_PLAIN_CREATE_TABLE_RE = re.compile(
+    rf'\s*create\s+(?:or\s+(?:replace|alter)\s+)?(?:(?:local|global|temp|temporary|volatile|transient)\s+)*'
+    rf'table\s+(?:if\s+not\s+exists\s+)?({_IDENT})\s*\.\s*({_IDENT})\s*\(',
+    re.IGNORECASE,
+)
+_SOURCE_KEYWORDS_RE = re.compile(r'\b(?:select|from|join|clone|like|using|as)\b', re.IGNORECASE)
+_DYNAMIC_TABLE_RE = re.compile(r'\bdynamic\s+table\b', re.IGNORECASE)
+_DYNAMIC_TABLE_OPTIONS_RE = re.compile(
+    r'\)\s*(?:target_lag|refresh_mode|initialize|warehouse)\b[\s\S]*?\bas\b',
+    re.IGNORECASE,
+)
 
-DIALECT = "snowflake"
 warnings.filterwarnings(
     "ignore",
     message=r"SQLLineage doesn't support analyzing statement type.*",
@@ -24,7 +62,8 @@ class SnowflakeName:
 
     @property
     def schema_qualified_name(self) -> str:
-        return f'{self.schema}.{self.name}'
+        # Interned since these are used as dict keys throughout the dependency graphs
+        return intern(f'{self.schema}.{self.name}')
 
 
 def extract_dependency_graph(root_dir: Path, quiet: bool = False) -> tuple[dict[str, Path], dict[str, set[str]]]:
@@ -33,8 +72,8 @@ def extract_dependency_graph(root_dir: Path, quiet: bool = False) -> tuple[dict[
       - object_to_file_map: normalized target object name -> Path to file defining it
       - dependencies_by_target: target object name -> set of normalized source object names
     """
-    # Use a simple recursive glob that actually finds all SQL files.
-    sql_files = list(root_dir.rglob("**/*.sql"))
+    # rglob already recurses, so a plain *.sql pattern finds all SQL files.
+    sql_files = list(root_dir.rglob("*.sql"))
     if not sql_files:
         return {}, {}
 
@@ -44,69 +83,316 @@ def extract_dependency_graph(root_dir: Path, quiet: bool = False) -> tuple[dict[
     expected_names = set((p.parent.parent.name + "." + p.stem).upper()
                          for p in sql_files)
 
-    for file_path in sql_files:
-        runner: LineageRunner | None = None
-        target_objects: list[SnowflakeName] = []
-        source_objects: list[SnowflakeName] = []
-        try:
-            file_sql = file_path.read_text(encoding="utf-8")
-            normalized_sql = _normalize_lineage_sql(file_sql)
-            runner = LineageRunner(file_path=str(file_path), dialect=DIALECT, sql=normalized_sql, silent_mode=True)
-            source_objects = [
-                SnowflakeName(name=t.raw_name.upper(), schema=t.schema.raw_name.upper())
-                for t in runner.source_tables
-            ]
-            target_objects = [
-                SnowflakeName(name=t.raw_name.upper(), schema=t.schema.raw_name.upper())
-                for t in runner.target_tables
-            ]
-        except SQLLineageException as e:
-            logging.debug("LineageRunner failed for %s: %s", file_path, e)
+    # Files generated from the same template often have identical contents, so only parse each distinct one once
+    files_by_contents: dict[bytes, list[Path]] = {}
+    with ThreadPoolExecutor(max_workers=min(_READ_THREADS, len(sql_files))) as executor:
+        for file_path, sql_bytes in zip(sql_files, executor.map(Path.read_bytes, sql_files)):
+            files_by_contents.setdefault(sql_bytes, []).append(file_path)
+    unique_contents = list(files_by_contents)
+    representative_paths = [paths[0] for paths in files_by_contents.values()]
+
+    if len(unique_contents) >= _PARALLEL_PARSE_MIN_FILES:
+        # Lineage parsing is CPU-bound and independent per file, so spread it over processes.
+        # expected_names is sent to each worker once, by its initializer.
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_parse_worker,
+            initargs=(expected_names, get_parse_cache_dir()),
+        ) as executor:
+            parsed_contents = list(executor.map(
+                _parse_sql_file_in_worker, representative_paths, unique_contents, chunksize=8))
+    else:
+        parsed_contents = [
+            _parse_sql_file(file_path, sql_bytes, expected_names)
+            for file_path, sql_bytes in zip(representative_paths, unique_contents)
+        ]
 
-        assumed_schema = file_path.parent.parent.name
-        assumed_obj_name = file_path.stem
+    parsed_by_path: dict[Path, tuple[Path, list[str], list[str], bool]] = {}
+    for sql_bytes, parsed in zip(unique_contents, parsed_contents):
+        representative_path, target_names, source_names, used_basic_parsing = parsed
+        parsed_by_path[representative_path] = parsed
+        for file_path in files_by_contents[sql_bytes][1:]:
+            if used_basic_parsing:
+                # Basic parsing names the target after the file, so its result can't be shared
+                parsed_by_path[file_path] = _parse_sql_file(file_path, sql_bytes, expected_names)
+            else:
+                parsed_by_path[file_path] = (file_path, target_names, source_names, used_basic_parsing)
 
-        if not runner or not target_objects:
+    for file_path in sql_files:
+        _, target_names, source_names, used_basic_parsing = parsed_by_path[file_path]
+        if used_basic_parsing:
+            assumed_schema = file_path.parent.parent.name
+            assumed_obj_name = file_path.stem
             if quiet:
                 logging.debug("Using basic parsing for: %s.%s", assumed_schema, assumed_obj_name)
             else:
                 print(f"Using basic parsing for: {assumed_schema}.{assumed_obj_name}")
-            sql = _normalize_lineage_sql(file_path.read_text(encoding="utf-8"))
-            target_name = SnowflakeName(name=assumed_obj_name.upper(), schema=assumed_schema.upper())
-            target_objects = [target_name]
-            possible_names = _find_possible_names_in_sql(sql, assumed_schema)
-            source_objects = [
-                n for n in possible_names
-                if n.schema_qualified_name in expected_names
-            ]
-
-        target_names = [t.schema_qualified_name for t in target_objects]
-        source_names = [
-            s.schema_qualified_name for s in source_objects if s not in target_objects
-        ]
 
+        source_names = [intern(s) for s in source_names]
         for qualified_target in target_names:
+            qualified_target = intern(qualified_target)
             path_by_obj[qualified_target] = file_path
-            dependencies_by_obj.setdefault(qualified_target, set()).update(source_names)
+            dependencies = dependencies_by_obj.get(qualified_target)
+            if dependencies is None:
+                dependencies_by_obj[qualified_target] = set(source_names)
+            else:
+                dependencies.update(source_names)
 
     return path_by_obj, dependencies_by_obj
 
 
+def _parse_sql_file(
+    file_path: Path,
+    sql_bytes: bytes,
+    expected_names: set[str],
+) -> tuple[Path, list[str], list[str], bool]:
+    """
+    Find the objects a single .sql file with contents sql_bytes creates and the objects it reads from.
+    Returns (file_path, target_names, source_names, used_basic_parsing).
+    """
+    normalized_sql = _normalize_lineage_sql(sql_bytes.decode("utf-8"))
+    plain_table = _match_plain_create_table(normalized_sql)
+    if plain_table:
+        return file_path, [plain_table.schema_qualified_name], [], False
+
+    lineage = cached_parse("table-references", sql_bytes, lambda: _extract_table_references(normalized_sql))
+    if not lineage["targets"]:
+        lineage = cached_parse(
+            f"lineage:{_lineage_config_key(file_path.parent)}",
+            sql_bytes,
+            lambda: _run_lineage(file_path, normalized_sql),
+        )
+    target_names: list[str] = lineage["targets"]
+    source_names: list[str] = lineage["sources"]
+
+    used_basic_parsing = not target_names
+    if used_basic_parsing:
+        assumed_schema = file_path.parent.parent.name
+        assumed_obj_name = file_path.stem
+        target_name = SnowflakeName(name=assumed_obj_name.upper(), schema=assumed_schema.upper())
+        target_names = [target_name.schema_qualified_name]
+        possible_names = _find_possible_names_in_sql(normalized_sql, assumed_schema)
+        source_names = [
+            n.schema_qualified_name for n in possible_names
+            if n.schema_qualified_name in expected_names
+        ]
+
+    source_names = [s for s in source_names if s not in target_names]
+    return file_path, target_names, source_names, used_basic_parsing
+
+
+def _extract_table_references(sql_text: str) -> dict:
+    """
+    Walk the sqlfluff parse tree of a single CREATE TABLE/VIEW statement for its target and
+    the tables it reads from, without building a full lineage graph.
+    Returns {"targets": [...], "sources": [...]} of qualified names, with no targets if the
+    SQL isn't a single cleanly parsed CREATE TABLE/VIEW, so the caller can fall back to LineageRunner.
+    """
+    no_result: dict = {"targets": [], "sources": []}
+    tree = parse_tree(sql_text, DIALECT)
+    if not tree or next(tree.recursive_crawl("unparsable"), None):
+        return no_result
+    statements = list(tree.recursive_crawl("statement", recurse_into=False))
+    if len(statements) != 1:
+        return no_result
+    statement = next((seg for seg in statements[0].segments if seg.is_type(*_CREATE_STATEMENT_TYPES)), None)
+    if statement is None:
+        return no_result
+
+    # Direct table references are the target, then e.g. a CLONE or LIKE source
+    direct_references = [seg for seg in statement.segments if seg.is_type("table_reference")]
+    if not direct_references:
+        return no_result
+    target = _table_reference_name(direct_references[0])
+    if not target:
+        return no_result
+
+    cte_names = set()
+    for cte in statement.recursive_crawl("common_table_expression"):
+        cte_name = next((seg for seg in cte.segments if seg.is_type("naked_identifier", "quoted_identifier")), None)
+        if cte_name:
+            cte_names.add(_strip_quotes(cte_name.raw).upper())
+
+    source_references = direct_references[1:]
+    for table_expression in statement.recursive_crawl("table_expression"):
+        reference = next((seg for seg in table_expression.segments if seg.is_type("table_reference")), None)
+        if reference and _strip_quotes(reference.raw).upper() not in cte_names:
+            source_references.append(reference)
+
+    sources = [_table_reference_name(reference) for reference in source_references]
+    return {"targets": [target], "sources": list(dict.fromkeys(s for s in sources if s))}
+
+
+def _table_reference_name(reference) -> str | None:
+    """Qualified name of a table_reference segment, named the same way LineageRunner names tables."""
+    parts = [
+        _strip_quotes(seg.raw).upper() for seg in reference.segments
+        if seg.is_type("naked_identifier", "quoted_identifier")
+    ]
+    if not parts:
+        return None
+    return SnowflakeName(name=parts[-1], schema=".".join(parts[:-1]) or "<DEFAULT>").schema_qualified_name
+
+
+@functools.lru_cache(maxsize=None)
+def _lineage_config_key(directory: Path) -> str:
+    """
+    Hash of the sqlfluff config LineageRunner resolves for files in directory,
+    since .sqlfluff and similar files along the path can change how it parses them.
+    """
+    config = FluffConfig.from_path(path=str(directory), overrides={"dialect": DIALECT})
+    return hashlib.blake2b(repr(list(config.iter_vals())).encode(), digest_size=16).hexdigest()
+
+
+def _run_lineage(file_path: Path, sql_text: str) -> dict:
+    """
+    Run LineageRunner over a file's SQL.
+    Returns {"targets": [...], "sources": [...]} of qualified names, with no targets if lineage failed.
+    """
+    try:
+        runner = LineageRunner(file_path=str(file_path), dialect=DIALECT, sql=sql_text, silent_mode=True)
+        source_objects = [
+            SnowflakeName(name=t.raw_name.upper(), schema=t.schema.raw_name.upper())
+            for t in runner.source_tables
+        ]
+        target_objects = [
+            SnowflakeName(name=t.raw_name.upper(), schema=t.schema.raw_name.upper())
+            for t in runner.target_tables
+        ]
+    except SQLLineageException as e:
+        logging.debug("LineageRunner failed for %s: %s", file_path, e)
+        return {"targets": [], "sources": []}
+    return {
+        "targets": [t.schema_qualified_name for t in target_objects],
+        "sources": [s.schema_qualified_name for s in source_objects],
+    }
+
+
+def _match_plain_create_table(sql_text: str) -> SnowflakeName | None:
+    """
+    Cheap regex check for a lone CREATE TABLE with a column list, which has no sources.
+    Returns None whenever the SQL might read from other objects.
+    """
+    match = _PLAIN_CREATE_TABLE_RE.match(sql_text)
+    if not match:
+        return None
+    if ';' in sql_text.rstrip().rstrip(';') or _SOURCE_KEYWORDS_RE.search(sql_text, match.end()):
+        return None
+    return SnowflakeName(
+        name=_strip_quotes(match.group(2)).upper(),
+        schema=_strip_quotes(match.group(1)).upper(),
+    )
+
+
+_worker_expected_names: set[str] = set()
+
+
+def _init_parse_worker(expected_names: set[str], cache_dir: Path | None) -> None:
+    global _worker_expected_names
+    _worker_expected_names = expected_names
+    configure_parse_cache(cache_dir)
+
+
+def _parse_sql_file_in_worker(file_path: Path, sql_bytes: bytes) -> tuple[Path, list[str], list[str], bool]:
+    return _parse_sql_file(file_path, sql_bytes, _worker_expected_names)
+
+
 def order_objects_topologically(
     objs: list[str],
     dependencies_by_obj: dict[str, set[str]],
 ) -> list[str]:
     """
     Returns a list of object names ordered topologically by their dependencies.
-    If a cycle is detected, returns objects in arbitrary order.
+    Objects in a dependency cycle are kept together, still after everything the cycle depends on.
     """
-    graph: dict[str, set[str]] = {obj: set() for obj in objs}
-    for obj, dependencies in dependencies_by_obj.items():
-        graph[obj] |= {d for d in dependencies if d != obj}
-    try:
-        return list(TopologicalSorter(graph).static_order())
-    except CycleError:
-        return list(graph.keys())
+    # Kahn's algorithm over integer ids, numbered in the order each object is first seen,
+    # so objects with no ordering between them keep the order they were given in.
+    names: list[str] = []
+    id_of: dict[str, int] = {}
+    dependants: list[list[int]] = []
+    in_degree = array('i')
+
+    def _get_id(name: str) -> int:
+        node_id = id_of.get(name)
+        if node_id is None:
+            node_id = id_of[name] = len(names)
+            names.append(name)
+            dependants.append([])
+            in_degree.append(0)
+        return node_id
+
+    for obj in dict.fromkeys(objs):
+        obj_id = _get_id(obj)
+        for dep in dependencies_by_obj.get(obj, ()):
+            if dep == obj:
+                continue
+            dependants[_get_id(dep)].append(obj_id)
+            in_degree[obj_id] += 1
+
+    ready = deque(node_id for node_id, degree in enumerate(in_degree) if degree == 0)
+    ordered: list[str] = []
+    while ready:
+        node_id = ready.popleft()
+        ordered.append(names[node_id])
+        for dependant_id in dependants[node_id]:
+            in_degree[dependant_id] -= 1
+            if in_degree[dependant_id] == 0:
+                ready.append(dependant_id)
+
+    if len(ordered) < len(names):
+        # Whatever Kahn's algorithm couldn't reach is in or downstream of a cycle.
+        # Order those by their strongly connected components instead.
+        remaining = [node_id for node_id, degree in enumerate(in_degree) if degree > 0]
+        for component in reversed(_strongly_connected_components(remaining, dependants)):
+            ordered.extend(names[node_id] for node_id in sorted(component))
+    return ordered
+
+
+def _strongly_connected_components(nodes: list[int], edges: list[list[int]]) -> list[list[int]]:
+    """
+    Iterative Tarjan's algorithm over the subgraph reachable from nodes.
+    Components are returned in reverse topological order of the edges.
+    """
+    index_of: dict[int, int] = {}
+    lowlink: dict[int, int] = {}
+    stack: list[int] = []
+    on_stack: set[int] = set()
+    components: list[list[int]] = []
+
+    def _visit(node: int) -> None:
+        index_of[node] = lowlink[node] = len(index_of)
+        stack.append(node)
+        on_stack.add(node)
+
+    for root in nodes:
+        if root in index_of:
+            continue
+        _visit(root)
+        work = [(root, iter(edges[root]))]
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in index_of:
+                    _visit(child)
+                    work.append((child, iter(edges[child])))
+                    break
+                if child in on_stack:
+                    lowlink[node] = min(lowlink[node], index_of[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index_of[node]:
+                    component: list[int] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
 
 
 def get_dependency_ordered_objects(root_dir: Path) -> list[tuple[str, Path, list[str]]]:
@@ -120,9 +406,10 @@ def get_dependency_ordered_objects(root_dir: Path) -> list[tuple[str, Path, list
         return []
     ordered_objects = order_objects_topologically(
         list(path_by_obj.keys()), dependencies_by_obj)
+    order_rank = {obj: i for i, obj in enumerate(ordered_objects)}
     return [
         (obj, path_by_obj[obj], sorted(
-            dependencies_by_obj[obj], key=ordered_objects.index))
+            dependencies_by_obj[obj], key=order_rank.__getitem__))
         for obj in ordered_objects if obj in path_by_obj
     ]
 
@@ -134,16 +421,15 @@ def collect_dependency_paths(root_dir: Path, target_table: str) -> set[Path]:
     path_by_obj, dependencies_by_obj = extract_dependency_graph(root_dir, quiet=True)
     normalized_target = _normalize_table_name(target_table)
 
-    visited: set[str] = set()
-    to_visit = [normalized_target]
+    # Mark objects as visited when queued so each is only queued once
+    visited: set[str] = {normalized_target}
+    to_visit = deque([normalized_target])
 
     while to_visit:
-        current = to_visit.pop()
-        if current in visited:
-            continue
-        visited.add(current)
-        for dep in dependencies_by_obj.get(current, set()):
+        current = to_visit.popleft()
+        for dep in dependencies_by_obj.get(current, ()):
             if dep not in visited:
+                visited.add(dep)
                 to_visit.append(dep)
 
     return {path_by_obj[obj] for obj in visited if obj in path_by_obj}
@@ -156,7 +442,7 @@ def extract_column_lineage_edges(root_dir: Path, include_paths: set[Path] | None
 
     Column names are normalized as SCHEMA.TABLE.COLUMN (upper-case).
     """
-    sql_files = list(root_dir.rglob("**/*.sql"))
+    sql_files = list(root_dir.rglob("*.sql"))
     if not sql_files:
         return {}
     if include_paths:
@@ -166,10 +452,6 @@ def extract_column_lineage_edges(root_dir: Path, include_paths: set[Path] | None
 
     for file_path in sql_files:
         try:
-            warnings.filterwarnings(
-                "ignore",
-                message=r"SQLLineage doesn't support analyzing statement type.*",
-            )
             file_sql = _normalize_lineage_sql(file_path.read_text(encoding="utf-8"))
             runner = LineageRunner(
                 file_path=str(file_path),
@@ -213,7 +495,7 @@ def extract_join_edges_by_target(root_dir: Path, include_paths: set[Path] | None
     Scan all .sql files and return join edges per target table.
     Each edge is (left_table, left_column, right_table, right_column).
     """
-    sql_files = list(root_dir.rglob("**/*.sql"))
+    sql_files = list(root_dir.rglob("*.sql"))
     if not sql_files:
         return {}
     if include_paths:
@@ -260,7 +542,7 @@ def extract_table_columns_by_object(root_dir: Path, include_paths: set[Path] | N
         sql_text = _normalize_lineage_sql(raw_sql)
         columns = _extract_defined_columns(sql_text)
         if columns:
-            columns_by_obj[obj_name] = columns
+            columns_by_obj[obj_name] = set(columns)
 
     return columns_by_obj
 
@@ -360,29 +642,26 @@ def build_debug_trace_plan(
 def _find_possible_names_in_sql(sql_text: str, assumed_schema_name: str) -> set[SnowflakeName]:
     """Lightweight regex-based scan to find qualified object names in SQL."""
 
-    # match 1-3 dot-separated identifiers, allowing double-quoted identifiers
-    ident = r'(?:[A-Za-z_][\w$]*|"[^"]+")'
-    pattern = re.compile(rf'\b{ident}(?:\s*\.\s*{ident}){{0,2}}\b')
+    sql_upper = sql_text.upper()
+    assumed_schema = assumed_schema_name.upper()
     names: set[SnowflakeName] = set()
-    for match in pattern.findall(sql_text):
-        # pattern.findall with this regex returns the whole match when there's
-        # one capture group; to be safe, re-run split
-        token = match if isinstance(match, str) else match[0]
-        parts = [p.strip().strip('"') for p in re.split(r'\s*\.\s*', token)]
-        if not parts:
-            continue
-        if len(parts) == 1:
-            names.add(SnowflakeName(parts[0].upper(), assumed_schema_name.upper()))
-        else:
+    for match in _NAME3_RE.finditer(sql_upper):
+        first, second, third = match.groups()
+        if third is not None:
             # use last two parts as schema.table
-            names.add(SnowflakeName(parts[-1].upper(), parts[-2].upper()))
+            schema, name = second, third
+        elif second is not None:
+            schema, name = first, second
+        else:
+            schema, name = assumed_schema, first
+        names.add(SnowflakeName(name.translate(_STRIP_QUOTES_TABLE), schema.translate(_STRIP_QUOTES_TABLE)))
     return names
 
 
 def _normalize_table_name(raw_table_name: str) -> str:
-    parts = [p.strip().strip('"') for p in re.split(r"\s*\.\s*", raw_table_name) if p.strip()]
+    parts = [p.strip().strip('"') for p in _DOT_SPLIT_RE.split(raw_table_name) if p.strip()]
     if len(parts) >= 2:
-        return f"{parts[-2].upper()}.{parts[-1].upper()}"
+        return intern(f"{parts[-2].upper()}.{parts[-1].upper()}")
     return raw_table_name.strip().strip('"').upper()
 
 
@@ -400,14 +679,15 @@ def _normalize_column_key(column_obj, assumed_schema: str) -> str:
             schema_name = assumed_schema
         if not table_name or not schema_name:
             return ""
-        return f"{schema_name.upper()}.{table_name.upper()}.{_normalize_column_name(column_obj.raw_name)}"
+        return intern(f"{schema_name.upper()}.{table_name.upper()}.{_normalize_column_name(column_obj.raw_name)}")
     except Exception:
         return ""
 
 
+@functools.lru_cache(maxsize=None)
 def _table_key(column_key: str) -> str:
     parts = column_key.split(".")
-    return f"{parts[0]}.{parts[1]}" if len(parts) >= 2 else column_key
+    return intern(f"{parts[0]}.{parts[1]}") if len(parts) >= 2 else column_key
 
 
 def _column_name(column_key: str) -> str:
@@ -416,25 +696,24 @@ def _column_name(column_key: str) -> str:
 
 
 def _extract_join_edges(sql_text: str) -> list[tuple[str, str, str, str]]:
-    ident = r'(?:[A-Za-z_][\w$]*|"[^"]+")'
-    table_pattern = rf'{ident}(?:\s*\.\s*{ident}){{1,2}}'
-    alias_pattern = ident
+    # Matched upper case, so captured identifiers need no further case mapping
+    sql_upper = sql_text.upper()
 
     alias_map: dict[str, str] = {}
-    for match in re.finditer(rf'\b(from|join)\s+({table_pattern})(?:\s+({alias_pattern}))?', sql_text, re.IGNORECASE):
+    for match in _JOIN_TABLE_RE.finditer(sql_upper):
         raw_table = match.group(2)
         raw_alias = match.group(3)
         table_name = _normalize_table_name(raw_table)
         alias_map[table_name] = table_name
         if raw_alias:
-            alias_map[_strip_quotes(raw_alias).upper()] = table_name
+            alias_map[_strip_quotes(raw_alias)] = table_name
 
     edges: list[tuple[str, str, str, str]] = []
-    for match in re.finditer(rf'({alias_pattern})\s*\.\s*({alias_pattern})\s*=\s*({alias_pattern})\s*\.\s*({alias_pattern})', sql_text, re.IGNORECASE):
-        left_alias = _strip_quotes(match.group(1)).upper()
-        left_col = _strip_quotes(match.group(2)).upper()
-        right_alias = _strip_quotes(match.group(3)).upper()
-        right_col = _strip_quotes(match.group(4)).upper()
+    for match in _JOIN_CONDITION_RE.finditer(sql_upper):
+        left_alias = _strip_quotes(match.group(1))
+        left_col = _strip_quotes(match.group(2))
+        right_alias = _strip_quotes(match.group(3))
+        right_col = _strip_quotes(match.group(4))
 
         left_table = alias_map.get(left_alias)
         right_table = alias_map.get(right_alias)
@@ -480,73 +759,62 @@ def _strip_quotes(value: str) -> str:
     return value.strip().strip('"')
 
 
+@functools.lru_cache(maxsize=None)
 def _fmt_identifier(value: str) -> str:
     return value.lower()
 
 
-def _extract_defined_columns(sql_text: str) -> set[str]:
+@functools.lru_cache(maxsize=4096)
+def _extract_defined_columns(sql_text: str) -> frozenset[str]:
     """
     Best-effort extraction of defined columns from CREATE TABLE or SELECT.
+    Cached by SQL text, since the SELECT fallback needs a full sqlfluff parse.
     """
     columns = _extract_columns_from_create_table(sql_text)
     if columns:
-        return columns
-    return _extract_columns_from_select(sql_text)
+        return frozenset(columns)
+    return frozenset(_extract_columns_from_select(sql_text))
 
 
 def _extract_columns_from_create_table(sql_text: str) -> set[str]:
-    match = re.search(r'\bcreate\b[\s\S]*?\btable\b[\s\S]*?\(', sql_text, re.IGNORECASE)
+    match = _CREATE_TABLE_COLUMNS_RE.search(sql_text)
     if not match:
         return set()
 
-    start = match.end() - 1
-    depth = 0
-    column_chars: list[str] = []
-    for idx in range(start, len(sql_text)):
-        ch = sql_text[idx]
+    # Single pass over the column list, jumping between parentheses and commas
+    # and slicing each top-level column definition straight out of sql_text.
+    columns: set[str] = set()
+    depth = 1
+    segment_start = match.end()
+    segment_end = len(sql_text)
+    for delimiter in _COLUMN_LIST_DELIMITERS_RE.finditer(sql_text, segment_start):
+        ch = delimiter.group()
         if ch == '(':
             depth += 1
-            if depth == 1:
-                continue
         elif ch == ')':
             depth -= 1
             if depth == 0:
+                segment_end = delimiter.start()
                 break
-        if depth >= 1:
-            column_chars.append(ch)
+        elif depth == 1:
+            _add_column_definition(columns, sql_text[segment_start:delimiter.start()])
+            segment_start = delimiter.end()
+    _add_column_definition(columns, sql_text[segment_start:segment_end])
+    return columns
 
-    if not column_chars:
-        return set()
 
-    column_text = ''.join(column_chars)
-    columns: set[str] = set()
-    segment = []
-    depth = 0
-    for ch in column_text:
-        if ch == '(':
-            depth += 1
-        elif ch == ')':
-            depth -= 1
-        if ch == ',' and depth == 0:
-            col = ''.join(segment).strip()
-            segment = []
-            if col:
-                columns.add(_strip_quotes(col.split()[0]).upper())
-        else:
-            segment.append(ch)
-    last = ''.join(segment).strip()
-    if last:
-        columns.add(_strip_quotes(last.split()[0]).upper())
-    return columns
+def _add_column_definition(columns: set[str], definition: str) -> None:
+    definition = definition.strip()
+    if definition:
+        columns.add(_strip_quotes(definition.split()[0]).upper())
 
 
 def _extract_columns_from_select(sql_text: str) -> set[str]:
     try:
-        linter = Linter(config=FluffConfig(overrides={"dialect": DIALECT}))
-        parsed = linter.parse_string(sql_text)
-        if not parsed.tree:
+        tree = parse_tree(sql_text, DIALECT)
+        if not tree:
             return set()
-        statement = next(parsed.tree.recursive_crawl("select_statement"), None)
+        statement = next(tree.recursive_crawl("select_statement"), None)
         if not statement:
             return set()
         select_clause = next(statement.recursive_crawl("select_clause"), None)
@@ -574,13 +842,8 @@ def _normalize_lineage_sql(sql_text: str) -> str:
     """
     Normalize Snowflake dynamic table DDL to improve lineage parsing.
     """
-    text = re.sub(r'\bdynamic\s+table\b', 'table', sql_text, flags=re.IGNORECASE)
-    text = re.sub(
-        r'\)\s*(?:target_lag|refresh_mode|initialize|warehouse)\b[\s\S]*?\bas\b',
-        ') as',
-        text,
-        flags=re.IGNORECASE,
-    )
+    text = _DYNAMIC_TABLE_RE.sub('table', sql_text)
+    text = _DYNAMIC_TABLE_OPTIONS_RE.sub(') as', text)
     return text
 
 
@@ -591,12 +854,11 @@ def parse_debug_query(sql_text: str) -> tuple[str, str | None, list[tuple[str, s
 
     filter_predicates are (column_name, value) with values left as raw SQL.
     """
-    linter = Linter(config=FluffConfig(overrides={"dialect": DIALECT}))
-    parsed = linter.parse_string(sql_text)
-    if not parsed.tree:
+    tree = parse_tree(sql_text, DIALECT)
+    if not tree:
         raise ValueError("Could not parse query.")
 
-    statement = next(parsed.tree.recursive_crawl("select_statement"), None)
+    statement = next(tree.recursive_crawl("select_statement"), None)
     if not statement:
         raise ValueError("Only SELECT queries are supported for parsing.")
 
@@ -708,28 +970,26 @@ def _build_cte_chain_for_paths(
     leaf_ctes: list[str] = []
     leaf_depths: dict[str, int] = {}
 
-    def _emit_children(node, parent_cte: str, prefix: str, depth: int) -> None:
-        children = node["children"]
-        if not children:
-            leaf_ctes.append(parent_cte)
-            leaf_depths[parent_cte] = depth
-            return
+    # Depth-first walk with an explicit stack so deep lineage trees can't hit the
+    # recursion limit. Each frame is [table, cte_name, depth, children_iter, join_edges, emitted].
+    stack = [[root_table, root_name, 0, enumerate(tree["children"]), join_edges_by_target.get(root_table, []), False]]
+    while stack:
+        frame = stack[-1]
+        parent_table, parent_cte, depth, children, join_edges = frame[:5]
 
-        emitted = False
-        for idx, child in enumerate(children):
-            child_name = f"{prefix}_{idx}"
-            parent_table = node["table"]
+        child_frame = None
+        for idx, child in children:
+            child_name = f"{parent_cte}_{idx}"
             child_table = child["table"]
-            join_edges = join_edges_by_target.get(parent_table, [])
             join_edge = _find_join_edge(parent_table, child_table, join_edges)
             if join_edge:
                 upstream_join_col, downstream_join_col, _ = join_edge
                 cte_lines.append(
                     f", {child_name} as (select * from {_fmt_identifier(child_table)} where {_fmt_identifier(upstream_join_col)} in (select {_fmt_identifier(downstream_join_col)} from {parent_cte}))"
                 )
-                _emit_children(child, child_name, child_name, depth + 1)
-                emitted = True
-                continue
+                child_frame = [child_table, child_name, depth + 1, enumerate(child["children"]),
+                               join_edges_by_target.get(child_table, []), False]
+                break
 
             if filter_predicates:
                 child_columns = table_columns_by_obj.get(child_table, set())
@@ -744,18 +1004,21 @@ def _build_cte_chain_for_paths(
                     cte_lines.append(
                         f", {child_name} as (select * from {_fmt_identifier(child_table)} where {filter_terms})"
                     )
-                    _emit_children(child, child_name, child_name, depth + 1)
-                    emitted = True
-                continue
+                    child_frame = [child_table, child_name, depth + 1, enumerate(child["children"]),
+                                   join_edges_by_target.get(child_table, []), False]
+                    break
 
+        if child_frame:
+            frame[5] = True
+            stack.append(child_frame)
             continue
 
-        if not emitted:
+        # All children handled; nodes that emitted no child CTE are leaves
+        stack.pop()
+        if not frame[5]:
             leaf_ctes.append(parent_cte)
             leaf_depths[parent_cte] = depth
 
-    _emit_children(tree, root_name, root_name, 0)
-
     if leaf_ctes:
         deepest_leaf = max(leaf_ctes, key=lambda name: (leaf_depths.get(name, 0), name))
         cte_lines.append(f"select * from {deepest_leaf};")
@@ -826,16 +1089,28 @@ def _extend_paths_with_table_dependencies(
     expanded: list[list[str]] = []
     seen: set[tuple[str, ...]] = set()
 
+    # Tables joined in each target's definition
+    join_tables_by_target: dict[str, frozenset[str]] = {
+        target: frozenset(table for left, _, right, _ in join_edges for table in (left, right))
+        for target, join_edges in join_edges_by_target.items()
+    }
+    deps_by_table: dict[str, list[str]] = {}
+
     def _deps_with_filters(table: str) -> list[str]:
+        candidates = deps_by_table.get(table)
+        if candidates is None:
+            candidates = deps_by_table[table] = _compute_deps_with_filters(table)
+        return candidates
+
+    def _compute_deps_with_filters(table: str) -> list[str]:
         deps = dependencies_by_obj.get(table, set())
         if not deps:
             return []
-        schema_prefix = table.split(".")[0] + "."
+        schema_prefix = table.partition(".")[0] + "."
         same_schema = [d for d in deps if d.startswith(schema_prefix)]
         cross_schema = [d for d in deps if not d.startswith(schema_prefix)]
 
-        join_edges = join_edges_by_target.get(table, [])
-        join_tables = {left for left, _, _, _ in join_edges} | {right for _, _, right, _ in join_edges}
+        join_tables = join_tables_by_target.get(table, frozenset())
 
         candidates = same_schema[:] if same_schema else []
         for dep in cross_schema:
@@ -854,37 +1129,69 @@ def _extend_paths_with_table_dependencies(
         ]
         return filtered if filtered else candidates
 
-    def _build_dep_paths(table: str, depth: int, visiting: set[str]) -> list[list[str]]:
+    # (table, depth) -> (paths, tables explored, explored tables that were being visited).
+    # A cached result is reused whenever its explored tables overlap the current
+    # visiting set in the same way, since only those can change the cycle pruning.
+    memo: dict[tuple[str, int], tuple[list[tuple[str, ...]], frozenset[str], frozenset[str]]] = {}
+    # Tables on the current dependency chain, shared by every call and empty again after each top-level one
+    visiting: set[str] = set()
+
+    def _enter(table: str, depth: int, stack: list) -> tuple[list[tuple[str, ...]], frozenset[str]] | None:
+        """Result for table at depth if it's known straight away, otherwise push a frame to build it."""
         if table in visiting:
-            return []
+            return [], frozenset((table,))
         if depth <= 0:
-            return [[table]]
+            return [(table,)], frozenset((table,))
+
+        cached = memo.get((table, depth))
+        if cached:
+            cached_paths, cached_explored, cached_blocked = cached
+            if cached_explored & visiting == cached_blocked:
+                return cached_paths, cached_explored
 
         deps = _deps_with_filters(table)
         if not deps:
-            return [[table]]
+            return [(table,)], frozenset((table,))
 
         visiting.add(table)
-        paths_out: list[list[str]] = []
-        for dep in deps:
-            for sub in _build_dep_paths(dep, depth - 1, visiting):
-                paths_out.append(sub + [table])
-        visiting.remove(table)
-        return paths_out
+        stack.append((table, depth, iter(deps), [], {table}))
+        return None
+
+    def _build_dep_paths(table: str, depth: int) -> tuple[list[tuple[str, ...]], frozenset[str]]:
+        # Explicit stack of tables whose dependencies are being expanded, so a large max_depth can't overflow
+        stack: list[tuple[str, int, Iterator[str], list[tuple[str, ...]], set[str]]] = []
+        result = _enter(table, depth, stack)
+        while stack:
+            table, depth, deps, paths_out, explored = stack[-1]
+            if result is not None:
+                sub_paths, sub_explored = result
+                explored |= sub_explored
+                paths_out.extend(sub + (table,) for sub in sub_paths)
+            dep = next(deps, None)
+            if dep is not None:
+                result = _enter(dep, depth - 1, stack)
+                continue
+
+            stack.pop()
+            visiting.remove(table)
+            frozen_explored = frozenset(explored)
+            memo[(table, depth)] = (paths_out, frozen_explored, frozen_explored & visiting)
+            result = paths_out, frozen_explored
+        return result
 
     for path in paths:
         if not path:
             continue
         source_table = _table_key(path[0])
-        dep_paths = _build_dep_paths(source_table, max_depth, set())
+        dep_paths, _ = _build_dep_paths(source_table, max_depth)
+        path_tail = tuple(intern(node) for node in path[1:])
 
         for dep_path in dep_paths:
-            merged = dep_path + path[1:]
-            key = tuple(merged)
+            key = dep_path + path_tail
             if key in seen:
                 continue
             seen.add(key)
-            expanded.append(merged)
+            expanded.append(list(key))
 
     return expanded
 
@@ -1,63 +1,106 @@
 import click
+import functools
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from itertools import chain
+from itertools import zip_longest
 
-from sqlfluff.core import Linter, FluffConfig
-from sqlfluff.core.parser import BaseSegment
+from sqlfluff.core.parser import BaseSegment, Lexer
 
 from cli.db import SnowflakeObject
-from .format import get_formatter
+from ._parse_cache import DIALECT, cached_parse, configure_parse_cache, get_linter, get_parse_cache_dir, parse_tree
+from .format import configure_formatter, get_formatter
+
+# Below this many files, process pool start-up costs more than diffing serially
+_PARALLEL_DIFF_MIN_FILES = 32
+
+_OBJECT_TYPE_KEYWORDS = frozenset(("TABLE", "VIEW", "PROCEDURE", "FUNCTION", "STREAM", "TASK", "POLICY"))
+_CREATE_CONTAINER_TYPES = frozenset(("statement", "unparsable"))
+# A file starting with a plain CREATE of a table, view, procedure or function with an unquoted name.
+# The name must not continue as a quoted or spaced-out identifier, so anything else is left to sqlfluff.
+_CREATE_HEADER_RE = re.compile(
+    r'\A(?:\s|--[^\n]*)*create\s+(?:or\s+(?:replace|alter)\s+)?'
+    r'(?:(?:local|global|temp|temporary|volatile|transient|dynamic|secure|materialized|recursive)\s+)*'
+    r'(table|view|procedure|function)\s+(?!if\b)([A-Za-z_][\w$]*(?:\.[A-Za-z_][\w$]*){0,2})(?![\w$."]|\s*\.)',
+    re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_lexer(dialect: str) -> Lexer:
+    return Lexer(config=get_linter(dialect).config)
+
+
+@functools.lru_cache(maxsize=4096)
+def _lex_code_tokens(sql: str, dialect: str) -> tuple[str, ...] | None:
+    """
+    Lex SQL to the raw text of its code tokens, dropping whitespace and comments, or None if it can't be lexed.
+    Lexing is far cheaper than formatting or parsing, and identical code tokens always parse identically.
+    """
+    try:
+        segments, errors = _get_lexer(dialect).lex(sql)
+    except (AttributeError, TypeError, ValueError):
+        return None
+    if errors:
+        return None
+    return tuple(segment.raw for segment in segments if segment.is_code)
 
 
 def get_semantic_structure(parsed_tree):
-    """Extract semantic elements, ignoring comments and whitespace."""
-    semantic_elements = []
-
-    def traverse(segment):
-        # Skip comment segments and whitespace-only segments
-        if segment.is_type("comment") or (hasattr(segment, 'raw') and segment.raw.isspace()):
-            return
-
-        # For meaningful segments, collect their type and content
-        if hasattr(segment, 'segments') and segment.segments:
-            for child in segment.segments:
-                traverse(child)
-        else:
-            # Leaf node - collect normalized content
-            if hasattr(segment, 'raw') and segment.raw.strip():
-                semantic_elements.append({
-                    'type': segment.get_type(),
-                    # Keep original case, formatter will handle normalization
-                    'content': segment.raw.strip()
-                })
-
-    traverse(parsed_tree)
-    return semantic_elements
-
-
-def are_semantically_equal(sql1: str, sql2: str, dialect="snowflake"):
+    """Extract semantic elements as (type, content) tuples, ignoring comments and whitespace."""
+    # Children are pushed reversed so leaves come out in source order
+    stack = [parsed_tree]
+    while stack:
+        segment = stack.pop()
+        children = getattr(segment, 'segments', None)
+        if children:
+            # Whitespace-only branches only contain whitespace leaves, which are skipped below
+            stack.extend(reversed(children))
+            continue
+
+        # Skip comments, which are always leaves
+        if segment.is_comment:
+            continue
+
+        # Leaf node - keep original case, formatter will handle normalization
+        content = getattr(segment, 'raw', '').strip()
+        if content:
+            yield (segment.get_type(), content)
+
+
+def are_semantically_equal(sql1: str, sql2: str, dialect=DIALECT):
     """Compare two SQL statements semantically, ignoring comments and whitespace."""
+    if sql1 == sql2:
+        return True
+    # Skip formatting and parsing when the statements have the same code tokens,
+    # i.e. they only differ by whitespace or comments
+    tokens1 = _lex_code_tokens(sql1, dialect)
+    if tokens1 is not None and tokens1 == _lex_code_tokens(sql2, dialect):
+        return True
+
     # Use formatter to standardize both SQL statements (handles casing, formatting, etc.)
     formatter = get_formatter()
 
     try:
         formatted_sql1 = formatter.format_sql(sql1)
         formatted_sql2 = formatter.format_sql(sql2)
+        if formatted_sql1 == formatted_sql2:
+            # Formatting normalized away every difference, so there's nothing left to parse
+            return True
 
         # Parse formatted SQL to extract semantic structure
-        config = FluffConfig(overrides={"dialect": dialect})
-        linter = Linter(config=config)
-
-        parsed1 = linter.parse_string(formatted_sql1)
-        parsed2 = linter.parse_string(formatted_sql2)
+        tree1 = parse_tree(formatted_sql1, dialect)
+        tree2 = parse_tree(formatted_sql2, dialect)
 
-        if not parsed1.tree or not parsed2.tree:
+        if not tree1 or not tree2:
             return formatted_sql1.strip() == formatted_sql2.strip()
 
-        semantic1 = get_semantic_structure(parsed1.tree)
-        semantic2 = get_semantic_structure(parsed2.tree)
-
-        return semantic1 == semantic2
+        # Stream both structures so the comparison stops at the first difference
+        return all(
+            element1 == element2
+            for element1, element2 in zip_longest(get_semantic_structure(tree1), get_semantic_structure(tree2))
+        )
     except (AttributeError, TypeError, ValueError):
         # If parsing fails, fall back to formatted string comparison
         try:
@@ -95,55 +138,123 @@ def get_objects_from_files(db_name: str, file_paths: list[Path]) -> list[tuple[s
     return object_identifiers
 
 
-def get_db_object_details(sql_text: str, dialect="snowflake"):
+def get_db_object_details(sql_text: str, dialect=DIALECT):
     """Parses SQL text to find the name and type of the created object."""
-    config = FluffConfig(overrides={"dialect": dialect})
-    linter = Linter(config=config)
-    parsed = linter.parse_string(sql_text)
-
-    if parsed.tree:
-        create_statements = (
-            # Fall back on unparsable segment if no valid create statement found
-            s for s in chain(parsed.tree.recursive_crawl('statement'), parsed.tree.recursive_crawl("unparsable"))
-            if _is_create_statement(s)
-        )
-
-        create_statement = next(create_statements, None)
-        segments = create_statement.recursive_crawl_all() if create_statement else []
+    # Most files start with a simple CREATE header, which doesn't need a full parse
+    match = _CREATE_HEADER_RE.match(sql_text)
+    if match:
+        return (match.group(1).upper(), match.group(2).upper())
+
+    details = cached_parse(
+        f"object-details:{dialect}", sql_text.encode(), lambda: _find_db_object_details(sql_text, dialect))
+    if not details["obj_type"]:
+        raise ValueError(
+            "Could not find a supported CREATE statement in the file.")
+    return (details["obj_type"], details["obj_name"])
+
+
+def _find_db_object_details(sql_text: str, dialect: str) -> dict:
+    """Returns {"obj_type": ..., "obj_name": ...} for the created object, with None values if there is none."""
+    tree = parse_tree(sql_text, dialect)
+    create_statement = _find_create_statement(tree) if tree else None
+
+    if create_statement:
+        # Pre-order walk of the statement, as recursive_crawl_all does, but with an explicit stack
+        stack = [create_statement]
         prev_keyword = ''
-        for segment in segments:
+        while stack:
+            segment = stack.pop()
             # When the parsing fails everything becomes a "word"
-            if (segment.is_type('keyword') or segment.is_type('word')) and segment.raw.upper() in ["TABLE", "VIEW", "PROCEDURE", "FUNCTION", "STREAM", "TASK", "POLICY"]:
+            if (segment.is_type('keyword') or segment.is_type('word')) and segment.raw.upper() in _OBJECT_TYPE_KEYWORDS:
                 prev_keyword = segment.raw
             elif prev_keyword and not segment.is_whitespace and not segment.is_comment:
-                return (prev_keyword.upper(), segment.raw.upper())
+                return {"obj_type": prev_keyword.upper(), "obj_name": segment.raw.upper()}
+            stack.extend(reversed(segment.segments))
+
+    return {"obj_type": None, "obj_name": None}
+
+
+def _find_create_statement(tree: BaseSegment) -> BaseSegment | None:
+    """
+    Find the first CREATE statement in a single walk of the tree,
+    falling back on the first CREATE in an unparsable segment if there is no valid one.
+    """
+    unparsable_create = None
+    stack = [tree]
+    while stack:
+        segment = stack.pop()
+        if segment.is_type('statement') and _is_create_statement(segment):
+            return segment
+        if unparsable_create is None and segment.is_type('unparsable') and _is_create_statement(segment):
+            unparsable_create = segment
+        # Only descend where a statement or unparsable segment could still be found
+        if not segment.descendant_type_set.isdisjoint(_CREATE_CONTAINER_TYPES):
+            stack.extend(reversed(segment.segments))
+    return unparsable_create
 
-    raise ValueError(
-        "Could not find a supported CREATE statement in the file.")
 
 def _is_create_statement(s: BaseSegment):
-    first_keyword = next(chain(s.recursive_crawl('keyword'), s.recursive_crawl('word')), None)
-    return first_keyword and first_keyword.raw.upper() == 'CREATE'
+    # Follow the first code child down to the first token
+    first_token = s
+    while first_token.segments:
+        first_token = next((child for child in first_token.segments if child.is_code), None)
+        if first_token is None:
+            return False
+    return first_token.raw.upper() == 'CREATE'
 
 
 def get_semantic_changed_files(ordered_files: list[tuple[str, Path]], db_objects: list[SnowflakeObject], scripts_path: Path) -> list[Path]:
-    changed_files: list[Path] = []
     db_ddls = {obj.schema_qualified_name.upper(): obj.ddl for obj in db_objects}
+    diff_paths: list[Path] = []
+    sql_pairs: list[tuple[str, str | None]] = []
     for (obj_name, file_path) in ordered_files:
         try:
             file_sql = file_path.read_text()
-            db_sql = db_ddls.get(obj_name.upper())
-            is_different, reason = semantic_diff(file_sql, db_sql)
-
-            if is_different:
-                changed_files.append(file_path)
-                click.echo(
-                    f"  - Change detected ({reason}): {file_path.relative_to(scripts_path)}")
         except (ValueError, IOError) as e:
             click.echo(f"Warning: Could not process {file_path}: {e}")
+            continue
+        # Dependency graph names are already upper case, so only normalize on a miss
+        db_sql = db_ddls.get(obj_name)
+        if db_sql is None:
+            db_sql = db_ddls.get(obj_name.upper())
+        diff_paths.append(file_path)
+        sql_pairs.append((file_sql, db_sql))
+
+    changed_files: list[Path] = []
+    for file_path, (is_different, reason) in zip(diff_paths, semantic_diff_many(sql_pairs)):
+        if is_different:
+            changed_files.append(file_path)
+            click.echo(
+                f"  - Change detected ({reason}): {file_path.relative_to(scripts_path)}")
     return changed_files
 
 
+def semantic_diff_many(sql_pairs: list[tuple[str, str | None]]) -> list[tuple[bool, str]]:
+    """
+    Run semantic_diff over each (file_sql, db_sql) pair, in parallel processes when there are many.
+    DB DDL must already be fetched, since connections can't be shared with the workers.
+    """
+    if len(sql_pairs) < _PARALLEL_DIFF_MIN_FILES:
+        return [semantic_diff(file_sql, db_sql) for file_sql, db_sql in sql_pairs]
+
+    # Formatting and parsing are CPU-bound and independent per file, so spread them over processes
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=_init_diff_worker,
+        initargs=(get_formatter().config_path, get_parse_cache_dir()),
+    ) as executor:
+        return list(executor.map(_semantic_diff_pair, sql_pairs, chunksize=8))
+
+
+def _init_diff_worker(config_path: Path | None, cache_dir: Path | None) -> None:
+    configure_formatter(config_path)
+    configure_parse_cache(cache_dir)
+
+
+def _semantic_diff_pair(sql_pair: tuple[str, str | None]) -> tuple[bool, str]:
+    return semantic_diff(*sql_pair)
+
+
 def semantic_diff(file_sql: str, db_sql: str | None):
     """
     Compares a local SQL file definition with the corresponding object in Snowflake.
@@ -1,8 +1,16 @@
 from sqlfluff.core import Linter, FluffConfig
 import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
+# Newlines sqlfluff puts before the equals of each dynamic table option
+_OPTION_EQUALS_NEWLINE_RE = re.compile(r'[\r\n]+=')
+_CREATE_TABLE_RE = re.compile(r'create\s+(or\s+replace\s+)?(transient\s+)?table', re.IGNORECASE)
+# Number of formatted SQL strings each formatter keeps, least recently used first out
+_FORMAT_CACHE_SIZE = 1024
+
 
 class SqlFormatter:
     """A SQL formatter that can be configured with a custom config path."""
@@ -18,22 +26,30 @@ class SqlFormatter:
         self.config_path = config_path
         self._config = None
         self._linter = None
+        # Formatted SQL by its input, safe to reuse since formatting is deterministic for a fixed config
+        self._format_cache: OrderedDict[str, str] = OrderedDict()
+        # Guards first-time construction, so concurrent callers share one config and linter, and the cache
+        self._lock = threading.RLock()
     
     def _get_config(self) -> FluffConfig:
         """Get the sqlfluff config, creating it if necessary."""
         if self._config is None:
-            if self.config_path:
-                # If a custom config path is provided, use it
-                self._config = FluffConfig.from_root(extra_config_path=str(self.config_path))
-            else:
-                # Use default behavior (search from current directory)
-                self._config = FluffConfig.from_root()
+            with self._lock:
+                if self._config is None:
+                    if self.config_path:
+                        # If a custom config path is provided, use it
+                        self._config = FluffConfig.from_root(extra_config_path=str(self.config_path))
+                    else:
+                        # Use default behavior (search from current directory)
+                        self._config = FluffConfig.from_root()
         return self._config
     
     def _get_linter(self) -> Linter:
         """Get the linter, creating it if necessary."""
         if self._linter is None:
-            self._linter = Linter(config=self._get_config())
+            with self._lock:
+                if self._linter is None:
+                    self._linter = Linter(config=self._get_config())
         return self._linter
     
     def format_sql(self, sql: str) -> str:
@@ -46,6 +62,13 @@ class SqlFormatter:
         Returns:
             The formatted SQL string
         """
+        with self._lock:
+            cached = self._format_cache.get(sql)
+            if cached is not None:
+                self._format_cache.move_to_end(sql)
+                return cached
+
+        original_sql = sql
         try:
             # Instantiate the rule for fix_string
             sql = self._force_create_or_alter_table(sql)
@@ -53,37 +76,42 @@ class SqlFormatter:
             result = linter.lint_string(sql, fix=True)
             fixed_str, _ = result.fix_string()
             fixed_str = self._fix_dynamic_table_options(fixed_str)
-            return fixed_str
         except Exception as e:
             # In case of any formatting errors, return the original sql
             print(f"Warning: Could not format SQL. Error: {e}")
             return sql
+
+        with self._lock:
+            self._format_cache[original_sql] = fixed_str
+            if len(self._format_cache) > _FORMAT_CACHE_SIZE:
+                self._format_cache.popitem(last=False)
+        return fixed_str
     
     def _fix_dynamic_table_options(self, fixed_str: str) -> str:
         """Fix dynamic table options formatting - they get a newline before each equals for some reason."""
-        return re.sub(r'[\r\n]+=', ' =', fixed_str)
+        # Every match ends in a newline directly before the equals, and most formatted SQL has none
+        if '\n=' not in fixed_str and '\r=' not in fixed_str:
+            return fixed_str
+        return _OPTION_EQUALS_NEWLINE_RE.sub(' =', fixed_str)
     
     def _force_create_or_alter_table(self, script_text: str) -> str:
         """Replace CREATE OR REPLACE TABLE with CREATE OR ALTER TABLE since tables shouldn't be replaced as it'll nuke their data."""
-        script_text = re.sub(
-            r'create\s+(or\s+replace\s+)?(transient\s+)?table',
-            r'create or alter \2table',
-            script_text,
-            flags=re.IGNORECASE
-        )
-        return script_text
+        return _CREATE_TABLE_RE.sub(r'create or alter \2table', script_text)
 
 
 # Global formatter instance - will be configured by the DI container
 _formatter: Optional[SqlFormatter] = None
+_formatter_lock = threading.Lock()
 
 
 def get_formatter() -> SqlFormatter:
     """Get the configured formatter instance."""
     global _formatter
     if _formatter is None:
-        # Fallback to default formatter if not configured
-        _formatter = SqlFormatter()
+        with _formatter_lock:
+            if _formatter is None:
+                # Fallback to default formatter if not configured
+                _formatter = SqlFormatter()
     return _formatter
 
 
@@ -0,0 +1,8 @@
+create or replace table sales.order_status_lookup (
+    status_code varchar,
+    status_name varchar
+);
+
+insert into sales.order_status_lookup (status_code, status_name)
+select status_code, status_name
+from sales.raw_order_statuses;